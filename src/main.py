@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 import os
+import ctypes
+import ctypes.util
 import time
-import tempfile
 import threading
 import pyaudio
-import wave
 import numpy as np
 import rumps
 from pynput import keyboard
-from pynput.keyboard import Key, Controller
 import faster_whisper
+import Quartz
+from AppKit import NSPasteboard, NSPasteboardItem, NSStringPboardType
 import signal
 from text_selection import TextSelection
 from bedrock_client import BedrockClient
@@ -32,6 +33,104 @@ def signal_handler(sig, frame):
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
+# Audio recording parameters (16 kHz mono 16-bit PCM, as Whisper expects)
+FORMAT = pyaudio.paInt16
+CHANNELS = 1
+SAMPLE_RATE = 16000
+CHUNK = 1024
+
+# Recordings shorter than MIN_RECORDING_SECONDS, or with less than
+# MIN_VOICED_MS of 30ms frames at or above MIN_SPEECH_RMS, are treated as
+# silence. The last TRAILING_CLICK_MS (the stop key's click) is ignored
+MIN_RECORDING_SECONDS = 0.25
+MIN_SPEECH_RMS = 200
+MIN_VOICED_MS = 200
+TRAILING_CLICK_MS = 100
+RMS_FRAME_MS = 30
+RMS_FRAME_SAMPLES = SAMPLE_RATE * RMS_FRAME_MS // 1000
+MIN_VOICED_FRAMES = -(-MIN_VOICED_MS // RMS_FRAME_MS)
+TRAILING_CLICK_SAMPLES = SAMPLE_RATE * TRAILING_CLICK_MS // 1000
+
+# whisper.cpp skips the encoder for input under 1s, so pad up to this length
+WHISPERCPP_MIN_SAMPLES = int(SAMPLE_RATE * 1.1)
+
+# macOS QoS classes from <sys/qos.h>
+QOS_CLASS_USER_INTERACTIVE = 0x21
+QOS_CLASS_USER_INITIATED = 0x19
+
+def set_thread_qos(qos_class):
+    """Set the QoS class of the calling thread (no-op outside macOS)"""
+    try:
+        libc = ctypes.CDLL(None)
+        set_qos = libc.pthread_set_qos_class_self_np
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not set thread QoS: {e}")
+        return
+    set_qos.restype = ctypes.c_int
+    result = set_qos(qos_class, 0)
+    if result != 0:
+        logger.debug(f"Could not set thread QoS: {os.strerror(result)}")
+
+# ANSI virtual keycode for 'v', used if the current layout can't be queried
+ANSI_V_KEYCODE = 9
+
+def keycode_for_char(char, default):
+    """
+    Find the virtual keycode that types char in the current keyboard layout,
+    so shortcuts like Cmd+V work on Dvorak and other non-QWERTY layouts.
+    """
+    try:
+        carbon = ctypes.CDLL(ctypes.util.find_library('Carbon'))
+        cf = ctypes.CDLL(ctypes.util.find_library('CoreFoundation'))
+        carbon.TISCopyCurrentKeyboardLayoutInputSource.restype = ctypes.c_void_p
+        carbon.TISCopyCurrentASCIICapableKeyboardLayoutInputSource.restype = ctypes.c_void_p
+        carbon.TISGetInputSourceProperty.restype = ctypes.c_void_p
+        carbon.TISGetInputSourceProperty.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        carbon.LMGetKbdType.restype = ctypes.c_uint8
+        cf.CFDataGetBytePtr.restype = ctypes.c_void_p
+        cf.CFDataGetBytePtr.argtypes = [ctypes.c_void_p]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        layout_key = ctypes.c_void_p.in_dll(carbon, 'kTISPropertyUnicodeKeyLayoutData')
+        
+        # Input methods (e.g. Japanese) have no layout data of their own
+        for copy_source in (carbon.TISCopyCurrentKeyboardLayoutInputSource,
+                            carbon.TISCopyCurrentASCIICapableKeyboardLayoutInputSource):
+            source = copy_source()
+            if not source:
+                continue
+            try:
+                layout_data = carbon.TISGetInputSourceProperty(source, layout_key)
+                if not layout_data:
+                    continue
+                layout = cf.CFDataGetBytePtr(layout_data)
+                kbd_type = carbon.LMGetKbdType()
+                dead_key_state = ctypes.c_uint32(0)
+                length = ctypes.c_ulong(0)
+                buf = (ctypes.c_uint16 * 4)()
+                for keycode in range(128):
+                    status = carbon.UCKeyTranslate(
+                        ctypes.c_void_p(layout), ctypes.c_uint16(keycode),
+                        ctypes.c_uint16(3),  # kUCKeyActionDisplay
+                        ctypes.c_uint32(0), ctypes.c_uint32(kbd_type),
+                        ctypes.c_uint32(1),  # kUCKeyTranslateNoDeadKeysMask
+                        ctypes.byref(dead_key_state), ctypes.c_ulong(len(buf)),
+                        ctypes.byref(length), buf
+                    )
+                    if status == 0 and length.value == 1 and chr(buf[0]) == char:
+                        return keycode
+            finally:
+                cf.CFRelease(source)
+    except (OSError, AttributeError, ValueError) as e:
+        logger.debug(f"Could not look up keycode for {char!r}: {e}")
+    return default
+
+class InteractiveKeyboardListener(keyboard.Listener):
+    """Keyboard listener whose event thread runs at user-interactive QoS"""
+    
+    def run(self):
+        set_thread_qos(QOS_CLASS_USER_INTERACTIVE)
+        super().run()
+
 class WhisperDictationApp(rumps.App):
     def __init__(self):
         super(WhisperDictationApp, self).__init__("🎙️", quit_button=rumps.MenuItem("Quit"))
@@ -46,8 +145,6 @@ class WhisperDictationApp(rumps.App):
         # Recording state
         self.recording = False
         self.audio = pyaudio.PyAudio()
-        self.frames = []
-        self.keyboard_controller = Controller()
         
         # Initialize text selection handler
         self.text_selector = TextSelection()
@@ -56,15 +153,23 @@ class WhisperDictationApp(rumps.App):
         self.bedrock_client = BedrockClient()
         
         # Initialize Whisper model
+        self.backend = os.getenv('WHISPER_BACKEND', 'faster-whisper').lower()
+        self.model_name = os.getenv('WHISPER_MODEL', 'small.en')
         self.model = None
+        self._model_lock = threading.Lock()
         self.load_model_thread = threading.Thread(target=self.load_model)
         self.load_model_thread.start()
         
-        # Audio recording parameters
-        self.format = pyaudio.paInt16
-        self.channels = 1
-        self.rate = 16000
-        self.chunk = 1024
+        # Preallocated PCM buffer (60s), grown on demand for longer recordings
+        self._buf = np.empty(SAMPLE_RATE * 60, dtype=np.int16)
+        self._write_idx = 0
+        
+        # Open the input stream once, paused; each recording just starts/stops it
+        self._stream = None
+        try:
+            self._stream = self._open_stream()
+        except OSError as e:
+            logger.warning(f"Could not open audio input stream, will retry when recording: {e}")
         
         # Hotkey configuration - we'll listen for globe/fn key (vk=63)
         self.trigger_key = 63  # Key code for globe/fn key
@@ -105,8 +210,9 @@ class WhisperDictationApp(rumps.App):
         # Stop recording if in progress
         if self.recording:
             self.recording = False
-            if hasattr(self, 'recording_thread') and self.recording_thread.is_alive():
-                self.recording_thread.join(timeout=1.0)
+        
+        # Close the input stream
+        self._close_stream()
         
         # Close PyAudio
         if hasattr(self, 'audio'):
@@ -119,15 +225,72 @@ class WhisperDictationApp(rumps.App):
         self.title = "🎙️ (Loading...)"
         self.status_item.title = "Status: Loading Whisper model..."
         try:
-            self.model = faster_whisper.WhisperModel("small.en")
+            model = None
+            if self.backend == "whispercpp":
+                try:
+                    model = self._load_whispercpp_model()
+                except Exception as e:
+                    # A WHISPER_COREML=1 build fails to initialise when the
+                    # ggml-<model>-encoder.mlmodelc bundle is missing
+                    logger.error(f"Error loading whisper.cpp model: {e}")
+                    logger.warning("Falling back to faster-whisper. For Core ML builds, make sure "
+                                   f"ggml-{self.model_name}-encoder.mlmodelc is in the pywhispercpp "
+                                   "models directory (see README)")
+                    self.backend = "faster-whisper"
+            if model is None:
+                model = self._load_faster_whisper_model()
+            
+            # Warm up with a dummy inference so the first dictation doesn't pay
+            # for kernel selection, thread pool spin-up and weight page faults
+            if self.backend == "whispercpp":
+                # whisper.cpp skips the encoder for input under 1s, so warm up
+                # on the padded minimum length
+                model.transcribe(np.zeros(WHISPERCPP_MIN_SAMPLES, dtype=np.float32), language="en")
+            else:
+                # 0.5s of silence is enough to exercise the encoder
+                warm = np.zeros(SAMPLE_RATE // 2, dtype=np.float32)
+                # The encoder is warmed without VAD (which would strip the
+                # silence); load the VAD model separately so the first
+                # vad_filter=True dictation doesn't load it lazily
+                list(model.transcribe(warm, beam_size=1, language="en")[0])
+                try:
+                    # Internal helper; faster-whisper is unpinned, so tolerate it moving
+                    from faster_whisper.vad import get_vad_model
+                    get_vad_model()
+                except ImportError as e:
+                    logger.warning(f"Could not preload VAD model: {e}")
+            
+            # Only publish the model once it is warm, so recording stays
+            # disabled while the menu still says it is loading
+            self.model = model
             self.title = "🎙️"
             self.status_item.title = "Status: Ready"
-            logger.info("Whisper model loaded successfully!")
+            logger.info(f"Whisper model {self.model_name} loaded successfully!")
         except Exception as e:
             self.title = "🎙️ (Error)"
             self.status_item.title = "Status: Error loading model"
             logger.error(f"Error loading model: {e}")
     
+    def _load_faster_whisper_model(self):
+        # int8 weights with explicit threading give the best CPU latency
+        # for short utterances
+        return faster_whisper.WhisperModel(
+            self.model_name,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+            num_workers=1
+        )
+    
+    def _load_whispercpp_model(self):
+        """
+        Load whisper.cpp via pywhispercpp. When pywhispercpp is built with
+        WHISPER_COREML=1 and the matching ggml-*-encoder.mlmodelc bundle sits
+        next to the model, the encoder runs on the Apple Neural Engine.
+        """
+        from pywhispercpp.model import Model
+        return Model(self.model_name, n_threads=max(1, (os.cpu_count() or 2) // 2))
+    
     def setup_global_monitor(self):
         # Create a separate thread to monitor for global key events
         self.key_monitor_thread = threading.Thread(target=self.monitor_keys)
@@ -138,26 +301,27 @@ class WhisperDictationApp(rumps.App):
         # Track state of key 63 (Globe/Fn key)
         self.is_recording_with_key63 = False
         
+        trigger_key = self.trigger_key
+        
         def on_press(key):
-            # Removed logging for every key press; log only when target key is pressed
-            if hasattr(key, 'vk') and key.vk == self.trigger_key:
-                logger.debug(f"Target key (vk={key.vk}) pressed")
+            # Bail out early for anything but the target key; this runs for every keystroke
+            if getattr(key, 'vk', None) != trigger_key:
+                return
+            logger.debug(f"Target key (vk={trigger_key}) pressed")
         
         def on_release(key):
-            if hasattr(key, 'vk'):
-                logger.debug(f"Key with vk={key.vk} released")
-                if key.vk == self.trigger_key:
-                    if not self.recording and not self.is_recording_with_key63:
-                        logger.debug(f"Globe/Fn key (vk={key.vk}) released - STARTING recording")
-                        self.is_recording_with_key63 = True
-                        self.start_recording()
-                    elif self.recording and self.is_recording_with_key63:
-                        logger.debug(f"Globe/Fn key (vk={key.vk}) released - STOPPING recording")
-                        self.is_recording_with_key63 = False
-                        self.stop_recording()
+            if getattr(key, 'vk', None) != trigger_key:
+                return
+            if not self.recording and not self.is_recording_with_key63:
+                logger.debug(f"Globe/Fn key (vk={trigger_key}) released - STARTING recording")
+                self.is_recording_with_key63 = self.start_recording()
+            elif self.recording and self.is_recording_with_key63:
+                logger.debug(f"Globe/Fn key (vk={trigger_key}) released - STOPPING recording")
+                self.is_recording_with_key63 = False
+                self.stop_recording()
         
         try:
-            with keyboard.Listener(on_press=on_press, on_release=on_release) as listener:
+            with InteractiveKeyboardListener(on_press=on_press, on_release=on_release) as listener:
                 logger.debug(f"Keyboard listener started - listening for key events")
                 logger.debug(f"Target key is Globe/Fn key (vk={self.trigger_key})")
                 logger.debug(f"Press and release the target key to control recording")
@@ -169,34 +333,92 @@ class WhisperDictationApp(rumps.App):
     @rumps.clicked("Start Recording")  # This will be matched by title
     def toggle_recording(self, sender):
         if not self.recording:
-            self.start_recording()
-            sender.title = "Stop Recording"
+            if self.start_recording():
+                sender.title = "Stop Recording"
         else:
             self.stop_recording()
             sender.title = "Start Recording"
     
     def start_recording(self):
+        """Start recording; returns True if the input stream was started"""
         if not hasattr(self, 'model') or self.model is None:
             logger.warning("Model not loaded. Please wait for the model to finish loading.")
             self.status_item.title = "Status: Waiting for model to load"
-            return
-            
-        self.frames = []
+            return False
+        
+        self._write_idx = 0
+        if not self._start_stream():
+            self.title = "🎙️"
+            self.status_item.title = "Status: Microphone unavailable"
+            return False
+        
         self.recording = True
         
         # Update UI
         self.title = "🎙️ (Recording)"
         self.status_item.title = "Status: Recording..."
         logger.info("Recording started. Speak now...")
-        
-        # Start recording thread
-        self.recording_thread = threading.Thread(target=self.record_audio)
-        self.recording_thread.start()
+        return True
+    
+    def _open_stream(self):
+        return self.audio.open(
+            format=FORMAT,
+            channels=CHANNELS,
+            rate=SAMPLE_RATE,
+            input=True,
+            frames_per_buffer=CHUNK,
+            stream_callback=self._audio_cb,
+            start=False
+        )
+    
+    def _close_stream(self):
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except:
+                pass
+            self._stream = None
+    
+    def _start_stream(self):
+        """
+        Resume the callback-driven input stream. If the input device has gone
+        away since the stream was opened, reopen it on the current default
+        device and retry once.
+        """
+        for attempt in range(2):
+            try:
+                if self._stream is None:
+                    self._stream = self._open_stream()
+                self._stream.start_stream()
+                return True
+            except OSError as e:
+                logger.warning(f"Error starting audio stream (attempt {attempt + 1}): {e}")
+                self._close_stream()
+                # PortAudio caches the device list, so reinitialise it to
+                # pick up the current default input device
+                self.audio.terminate()
+                self.audio = pyaudio.PyAudio()
+        logger.error("Could not start audio input stream")
+        return False
     
     def stop_recording(self):
         self.recording = False
-        if hasattr(self, 'recording_thread'):
-            self.recording_thread.join()
+        try:
+            self._stream.stop_stream()
+        except OSError as e:
+            # The device went away mid-recording; keep what was captured
+            logger.warning(f"Error stopping audio stream: {e}")
+            self._close_stream()
+        
+        # Snapshot the recording now that the stream is stopped; the shared
+        # buffer is reused as soon as the next recording starts. Convert the
+        # 16-bit PCM into the float32 [-1, 1] array faster_whisper expects,
+        # avoiding a WAV encode/decode round trip, in a single fused
+        # cast-and-scale pass that also serves as the copy
+        n = self._write_idx
+        audio = np.empty(n, dtype=np.float32)
+        np.multiply(self._buf[:n], np.float32(1.0 / 32768.0), out=audio)
         
         # Update UI
         self.title = "🎙️ (Transcribing)"
@@ -204,68 +426,100 @@ class WhisperDictationApp(rumps.App):
         logger.info("Recording stopped. Transcribing...")
         
         # Process in background
-        transcribe_thread = threading.Thread(target=self.process_recording)
+        transcribe_thread = threading.Thread(target=self.process_recording, args=(audio,))
         transcribe_thread.start()
     
-    def process_recording(self):
+    def process_recording(self, audio):
+        # Run transcription below the UI and keyboard listener threads
+        set_thread_qos(QOS_CLASS_USER_INITIATED)
+        
         # Transcribe and insert text
         try:
-            self.transcribe_audio()
+            self.transcribe_audio(audio)
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             self.status_item.title = "Status: Error during transcription"
         finally:
             self.title = "🎙️"  # Reset title
     
-    def record_audio(self):
-        stream = self.audio.open(
-            format=self.format,
-            channels=self.channels,
-            rate=self.rate,
-            input=True,
-            frames_per_buffer=self.chunk
-        )
-        
-        while self.recording:
-            data = stream.read(self.chunk)
-            self.frames.append(data)
-            
-        stream.stop_stream()
-        stream.close()
+    def _audio_cb(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback - copies each buffer into the PCM buffer"""
+        arr = np.frombuffer(in_data, dtype=np.int16)
+        n = arr.size
+        if self._write_idx + n > self._buf.size:
+            self._buf = np.resize(self._buf, self._buf.size * 2)
+        self._buf[self._write_idx:self._write_idx + n] = arr
+        self._write_idx += n
+        return (None, pyaudio.paContinue)
     
-    def transcribe_audio(self):
-        if not self.frames:
+    def transcribe_audio(self, audio):
+        """Transcribe a float32 recording snapshot and insert the text"""
+        if audio.size == 0:
             self.title = "🎙️"
             self.status_item.title = "Status: No audio recorded"
             logger.warning("No audio recorded")
             return
-            
-        # Save the recorded audio to a temporary file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_filename = temp_file.name
         
-        with wave.open(temp_filename, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
-            wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
+        # Skip the model entirely for accidental taps and near-silence, which
+        # also avoids Whisper hallucinating text from background noise. The
+        # tail holds the click of the key that stopped the recording, so it is
+        # left out, and a minimum amount of voiced audio is required rather
+        # than a single loud frame. Counting frames (instead of whole-recording
+        # RMS) keeps pauses in a long recording from hiding speech
+        gated = audio[:max(0, audio.size - TRAILING_CLICK_SAMPLES)]
+        n_frames = gated.size // RMS_FRAME_SAMPLES
+        voiced_frames = 0
+        if n_frames:
+            frames = gated[:n_frames * RMS_FRAME_SAMPLES].reshape(n_frames, RMS_FRAME_SAMPLES)
+            # Back in int16 units to compare against MIN_SPEECH_RMS
+            frame_rms = np.sqrt(np.mean(np.square(frames), axis=1)) * 32768.0
+            voiced_frames = int(np.count_nonzero(frame_rms >= MIN_SPEECH_RMS))
+        if audio.size < SAMPLE_RATE * MIN_RECORDING_SECONDS or voiced_frames < MIN_VOICED_FRAMES:
+            self.status_item.title = "Status: No speech detected"
+            logger.warning(f"No speech detected ({voiced_frames * RMS_FRAME_MS}ms voiced, "
+                           f"{audio.size / SAMPLE_RATE:.2f}s recorded)")
+            return
         
-        logger.debug("Audio saved to temporary file. Transcribing...")
+        logger.debug("Audio buffer prepared. Transcribing...")
         
         # Transcribe with Whisper
         try:
-            segments, _ = self.model.transcribe(temp_filename, beam_size=5)
-            
-            text = ""
-            for segment in segments:
-                text += segment.text
+            # Greedy decoding with VAD suits short dictation; a fixed language
+            # skips the detection pass
+            # Each recording gets its own thread, so serialise model use:
+            # whisper.cpp shares a single context that isn't thread-safe.
+            # faster-whisper decodes lazily, so the segments are consumed
+            # inside the lock as well
+            with self._model_lock:
+                if self.backend == "whispercpp":
+                    if audio.size < WHISPERCPP_MIN_SAMPLES:
+                        audio = np.pad(audio, (0, WHISPERCPP_MIN_SAMPLES - audio.size))
+                    segments = self.model.transcribe(audio, language="en")
+                else:
+                    segments, _ = self.model.transcribe(
+                        audio,
+                        beam_size=1,
+                        best_of=1,
+                        language="en",
+                        condition_on_previous_text=False,
+                        vad_filter=True,
+                        vad_parameters=dict(min_silence_duration_ms=300)
+                    )
+                
+                text = "".join(segment.text for segment in segments).strip()
             
             if text:
-                #  What does this look like?
-                selected_text = self.text_selector.get_selected_text()
-                logger.debug(f"Selected text: {selected_text}")
+                # Only probe for a selection when it can be used; the probe
+                # goes through the clipboard and sleeps ~300ms. TextSelection
+                # only restores plain text, so keep the full pasteboard around it
+                selected_text = None
+                if self.bedrock_client.is_available():
+                    saved_items = self._save_pasteboard()
+                    selected_text = self.text_selector.get_selected_text()
+                    self._restore_pasteboard(saved_items)
+                    logger.debug(f"Selected text: {selected_text}")
                 
-                if selected_text and self.bedrock_client.is_available():
+                if selected_text:
                     logger.info(f"Selected text detected: {selected_text[:50]}...")
                     logger.info(f"Voice instruction: {text}")
                     
@@ -297,15 +551,53 @@ class WhisperDictationApp(rumps.App):
             logger.error(f"Transcription error: {e}")
             self.status_item.title = "Status: Transcription error"
             raise
-        finally:
-            # Clean up the temporary file
-            os.unlink(temp_filename)
+    
+    def _save_pasteboard(self):
+        """
+        Snapshot every pasteboard item with all of its types (images, files,
+        rich text). Items are invalidated by clearContents(), so the data is
+        copied out now.
+        """
+        pasteboard = NSPasteboard.generalPasteboard()
+        return [[(t, item.dataForType_(t)) for t in item.types()]
+                for item in pasteboard.pasteboardItems() or []]
+    
+    def _restore_pasteboard(self, saved_items):
+        """Replace the pasteboard contents with a snapshot from _save_pasteboard"""
+        pasteboard = NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        if saved_items:
+            restored = []
+            for types in saved_items:
+                item = NSPasteboardItem.alloc().init()
+                for t, data in types:
+                    if data is not None:
+                        item.setData_forType_(data, t)
+                restored.append(item)
+            pasteboard.writeObjects_(restored)
     
     def insert_text(self, text):
-        # Type text at cursor position without altering the clipboard
-        logger.debug("Typing text at cursor position...")
-        self.keyboard_controller.type(text)
-        logger.debug("Text typed successfully")
+        # Paste via the pasteboard and a native Cmd+V instead of typing each
+        # character, then restore the user's clipboard
+        logger.debug("Pasting text at cursor position...")
+        saved_items = self._save_pasteboard()
+        
+        pasteboard = NSPasteboard.generalPasteboard()
+        pasteboard.clearContents()
+        pasteboard.setString_forType_(text, NSStringPboardType)
+        
+        # Resolve 'v' per paste, since the user can switch layouts at any time
+        v_keycode = keycode_for_char('v', ANSI_V_KEYCODE)
+        source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(source, v_keycode, key_down)
+            Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+        
+        # Give the target app time to read the pasteboard before restoring it
+        time.sleep(0.2)
+        self._restore_pasteboard(saved_items)
+        logger.debug("Text pasted successfully")
     
     def handle_shutdown(self, _signal, _frame):
         """This method is no longer used with the global handler approach"""